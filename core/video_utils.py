@@ -55,27 +55,31 @@ class VideoGenerator:
     
     def create_video_from_frames(
         self,
-        frames: List[Image.Image],
+        frames: List,
         output_path: Path,
         size: Optional[Tuple[int, int]] = None
     ) -> Path:
         """
-        Create video from PIL Image frames.
-        
+        Create video from image frames.
+
         Args:
-            frames: List of PIL Images
+            frames: List of PIL Images and/or HxWx3 uint8 RGB numpy arrays
             output_path: Path to save video (extension will be corrected)
             size: Optional (width, height) tuple. If None, uses first frame size
-            
+
         Returns:
             Path to created video file
         """
         if not frames:
             raise ValueError("No frames provided")
-        
+
         # Get video size
         if size is None:
-            size = frames[0].size
+            first = frames[0]
+            if isinstance(first, np.ndarray):
+                size = (first.shape[1], first.shape[0])
+            else:
+                size = first.size
         
         width, height = size
         
@@ -94,18 +98,31 @@ class VideoGenerator:
             (width, height)
         )
         
+        # Reusable BGR output buffer - VideoWriter.write encodes immediately,
+        # so the same buffer can back every frame
+        bgr_buffer = np.empty((height, width, 3), dtype=np.uint8)
+
         # Write frames
         for frame in frames:
+            # RGB array frames go straight to the converter - no PIL round trip
+            if isinstance(frame, np.ndarray):
+                cv2.cvtColor(frame, cv2.COLOR_RGB2BGR, dst=bgr_buffer)
+                writer.write(bgr_buffer)
+                continue
+
             # Ensure RGB and correct size
             if frame.size != size:
                 frame = frame.resize(size, Image.Resampling.LANCZOS)
-            
-            # Convert PIL Image to OpenCV format (BGR)
-            frame_rgb = frame.convert('RGB')
-            frame_array = np.array(frame_rgb)
-            frame_bgr = cv2.cvtColor(frame_array, cv2.COLOR_RGB2BGR)
-            
-            writer.write(frame_bgr)
+            if frame.mode != 'RGB':
+                frame = frame.convert('RGB')
+
+            # Convert PIL Image to OpenCV format (BGR) without extra copies:
+            # np.asarray avoids the copy np.array would make, and cvtColor
+            # writes into the preallocated buffer
+            frame_array = np.asarray(frame)
+            cv2.cvtColor(frame_array, cv2.COLOR_RGB2BGR, dst=bgr_buffer)
+
+            writer.write(bgr_buffer)
         
         writer.release()
         return output_path
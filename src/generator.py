@@ -7,11 +7,14 @@
 ╚══════════════════════════════════════════════════════════════════════════════╝
 """
 
+import os
 import random
 import math
 import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
 from core import BaseGenerator, TaskPair, ImageRenderer
@@ -19,25 +22,108 @@ from core.video_utils import VideoGenerator
 from .config import TaskConfig
 from .prompts import get_prompt
 
+# Check if numba is available (optional - used to JIT the dial interpolation)
+import importlib.util
+
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+
+# Dial angles are quantized to whole degrees, so the indicator direction for
+# every possible angle (0° at top) can be tabulated once at import time
+_DIAL_COS = tuple(math.cos(math.radians(a - 90)) for a in range(360))
+_DIAL_SIN = tuple(math.sin(math.radians(a - 90)) for a in range(360))
+
+# Panel palette - shared tuples so the hot draw paths don't rebuild color
+# literals on every call
+_COL_FRAME = (80, 80, 90)
+_COL_OUTLINE = (60, 60, 70)
+_COL_LABEL = (200, 200, 200)
+_COL_KNOB = (220, 220, 220)
+_COL_KNOB_OUTLINE = (40, 40, 50)
+_COL_RAIL_OFF = (60, 60, 70)
+_COL_RAIL_ON = (60, 150, 80)
+_COL_TRACK = (60, 60, 70)
+_COL_TRACK_FILL = (70, 130, 200)
+_COL_VALUE_TEXT = (180, 180, 180)
+_COL_BUTTON_PRESSED = (80, 150, 80)
+_COL_BUTTON_IDLE = (100, 120, 150)
+_COL_BUTTON_SHADOW = (20, 20, 25)
+_COL_BUTTON_LABEL = (255, 255, 255)
+_COL_DIAL = (80, 80, 90)
+_COL_DIAL_POINTER = (255, 200, 50)
+_COL_DIAL_CENTER = (200, 200, 200)
+
+
+if NUMBA_AVAILABLE:
+    from numba import njit
+
+    @njit(cache=True)
+    def _dial_arc_trajectory(initial: float, diff: float, num_frames: int) -> np.ndarray:
+        """Shortest-arc dial angles per transition frame (degrees, [0, 360))."""
+        out = np.empty(num_frames, dtype=np.int64)
+        for i in range(num_frames):
+            progress = 1.0 if num_frames == 1 else i / (num_frames - 1)
+            out[i] = int((initial + diff * progress) % 360)
+        return out
+else:
+    def _dial_arc_trajectory(initial: float, diff: float, num_frames: int) -> np.ndarray:
+        """Shortest-arc dial angles per transition frame (degrees, [0, 360))."""
+        if num_frames > 1:
+            progress = np.linspace(0.0, 1.0, num_frames)
+        else:
+            progress = np.ones(1)
+        return ((initial + diff * progress) % 360).astype(np.int64)
+
+
+# Worker-process state for generate_batch: each worker builds one generator
+# from the config and reuses it for every task it is handed
+_worker_generator: Optional["TaskGenerator"] = None
+
+
+def _init_batch_worker(config: TaskConfig) -> None:
+    global _worker_generator
+    _worker_generator = TaskGenerator(config)
+
+
+def _generate_task_in_worker(job: Tuple[str, Optional[int]]) -> TaskPair:
+    task_id, seed = job
+    if seed is not None:
+        random.seed(seed)
+        np.random.seed(seed % (2 ** 32))
+    return _worker_generator.generate_task_pair(task_id)
+
 
 class ControlPanel:
-    """Represents a control panel with various controls."""
-    
+    """
+    Represents a control panel with various controls.
+
+    Control attributes live in parallel lists (struct-of-arrays) so the
+    per-frame animation loop indexes lists directly instead of paying a dict
+    lookup per attribute per control per frame.
+    """
+
     def __init__(self):
-        self.controls: List[Dict] = []
-    
-    def add_control(self, control_type: str, position: Tuple[int, int], 
-                    size: Tuple[int, int], initial_state: any, 
+        self.types: List[str] = []
+        self.positions: List[Tuple[int, int]] = []
+        self.sizes: List[Tuple[int, int]] = []
+        self.initial_states: List = []
+        self.target_states: List = []
+        self.labels: List[str] = []
+        self.geometries: List[Dict] = []
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    def add_control(self, control_type: str, position: Tuple[int, int],
+                    size: Tuple[int, int], initial_state: any,
                     target_state: any, label: str = ""):
         """Add a control to the panel."""
-        self.controls.append({
-            "type": control_type,
-            "position": position,
-            "size": size,
-            "initial_state": initial_state,
-            "target_state": target_state,
-            "label": label
-        })
+        self.types.append(control_type)
+        self.positions.append(position)
+        self.sizes.append(size)
+        self.initial_states.append(initial_state)
+        self.target_states.append(target_state)
+        self.labels.append(label)
+        self.geometries.append({})
 
 
 class TaskGenerator(BaseGenerator):
@@ -51,11 +137,19 @@ class TaskGenerator(BaseGenerator):
     def __init__(self, config: TaskConfig):
         super().__init__(config)
         self.renderer = ImageRenderer(image_size=config.image_size)
-        
+
+        # Resolve a usable font file once; fonts themselves are cached per size
+        self._font_path = self._find_font_path()
+        self._font_cache: Dict[int, Optional[ImageFont.ImageFont]] = {}
+
         # Initialize video generator if enabled
         self.video_generator = None
+        self._video_dir: Optional[Path] = None
         if config.generate_videos and VideoGenerator.is_available():
             self.video_generator = VideoGenerator(fps=config.video_fps, output_format="mp4")
+            # Create the temp video directory once rather than per task
+            self._video_dir = Path(tempfile.gettempdir()) / f"{config.domain}_videos"
+            self._video_dir.mkdir(parents=True, exist_ok=True)
     
     def generate_task_pair(self, task_id: str) -> TaskPair:
         """Generate one control panel task pair."""
@@ -63,9 +157,8 @@ class TaskGenerator(BaseGenerator):
         # Generate panel configuration
         panel_data = self._generate_panel_data()
         
-        # Render images
-        first_image = self._render_panel(panel_data, render_target=False)
-        final_image = self._render_panel(panel_data, render_target=True)
+        # Render images (both states in a single pass over the controls)
+        first_image, final_image = self._render_panel_pair(panel_data)
         
         # Generate video (optional)
         video_path = None
@@ -83,7 +176,31 @@ class TaskGenerator(BaseGenerator):
             final_image=final_image,
             ground_truth_video=video_path
         )
-    
+
+    def generate_batch(self, task_ids: List[str]) -> List[TaskPair]:
+        """
+        Generate task pairs in parallel across worker processes.
+
+        Tasks are independent, so they fan out over a ProcessPoolExecutor.
+        When config.random_seed is set, each task gets its own derived seed,
+        so results are deterministic regardless of worker scheduling.
+        """
+        if not task_ids:
+            return []
+
+        base_seed = self.config.random_seed
+        jobs = [
+            (task_id, None if base_seed is None else base_seed + i)
+            for i, task_id in enumerate(task_ids)
+        ]
+
+        with ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            initializer=_init_batch_worker,
+            initargs=(self.config,),
+        ) as executor:
+            return list(executor.map(_generate_task_in_worker, jobs))
+
     # ══════════════════════════════════════════════════════════════════════════
     #  PANEL GENERATION
     # ══════════════════════════════════════════════════════════════════════════
@@ -100,9 +217,16 @@ class TaskGenerator(BaseGenerator):
         panel_width = width - 2 * margin
         panel_height = height - 2 * margin
         
-        # Available control types
-        available_types = self.config.control_types.copy()
-        
+        # Draw control types without replacement, starting a fresh round if
+        # the panel needs more controls than there are types
+        type_pool = self.config.control_types
+        if not type_pool:
+            raise ValueError("control_types must be non-empty")
+        control_types_used: List[str] = []
+        while len(control_types_used) < num_controls:
+            take = min(len(type_pool), num_controls - len(control_types_used))
+            control_types_used.extend(random.sample(type_pool, take))
+
         # Determine layout (grid or vertical)
         use_grid = num_controls >= 4
         if use_grid:
@@ -116,15 +240,7 @@ class TaskGenerator(BaseGenerator):
             cell_width = panel_width
             cell_height = panel_height // rows
         
-        control_types_used = []
-        for i in range(num_controls):
-            # Select control type
-            if not available_types:
-                available_types = self.config.control_types.copy()
-            ctype = random.choice(available_types)
-            available_types.remove(ctype)
-            control_types_used.append(ctype)
-            
+        for i, ctype in enumerate(control_types_used):
             # Calculate position
             if use_grid:
                 col = i % cols
@@ -151,7 +267,10 @@ class TaskGenerator(BaseGenerator):
                 target_state=target_state,
                 label=label
             )
-        
+
+        # Precompute frame-invariant geometry for each control
+        self._precompute_control_geometry(panel)
+
         # Determine task type for prompts
         task_type = "default"
         if all(ct == "switch" for ct in control_types_used):
@@ -162,23 +281,20 @@ class TaskGenerator(BaseGenerator):
         return {
             "panel": panel,
             "task_type": task_type,
-            "controls": panel.controls
         }
     
     def _generate_control_states(self, control_type: str) -> Tuple[any, any, str]:
         """Generate initial and target states for a control."""
         if control_type == "switch":
-            initial = random.choice([True, False])
+            initial = bool(random.getrandbits(1))
             target = not initial
             label = random.choice(["Power", "Mode", "Enable", "State"])
             return initial, target, label
-        
+
         elif control_type == "slider":
-            initial = random.randint(0, 100)
-            target = random.randint(0, 100)
-            # Ensure they're different
-            while target == initial:
-                target = random.randint(0, 100)
+            initial = random.randrange(101)
+            # Offset by a nonzero amount so target differs - no retry loop
+            target = (initial + random.randrange(1, 101)) % 101
             label = random.choice(["Volume", "Speed", "Level", "Value"])
             return initial, target, label
         
@@ -190,10 +306,10 @@ class TaskGenerator(BaseGenerator):
             return initial, target, label
         
         elif control_type == "dial":
-            initial = random.randint(0, 360)
-            target = random.randint(0, 360)
-            while abs(target - initial) < 30:  # Ensure meaningful change
-                target = random.randint(0, 360)
+            initial = random.randrange(360)
+            # Offset by at least 30 degrees either way for a meaningful change,
+            # which guarantees validity without rejection sampling
+            target = (initial + random.randrange(30, 331)) % 360
             label = random.choice(["Rotation", "Angle", "Position"])
             return initial, target, label
         
@@ -205,6 +321,47 @@ class TaskGenerator(BaseGenerator):
     #  RENDERING
     # ══════════════════════════════════════════════════════════════════════════
     
+    def _precompute_control_geometry(self, panel: ControlPanel) -> None:
+        """
+        Precompute geometry that is invariant across frames for each control.
+
+        Rail/track/dial dimensions, fonts and label bounding boxes only depend
+        on the control's size and label, so computing them once per panel
+        avoids redoing the work (textbbox in particular) on every frame.
+        """
+        measure = ImageDraw.Draw(Image.new('RGB', (1, 1)))
+
+        for j in range(len(panel)):
+            ctype = panel.types[j]
+            w, h = panel.sizes[j]
+            font = self._get_font(max(12, min(w, h) // 6))
+            geom = {"font": font}
+
+            label = panel.labels[j]
+            if font and label:
+                bbox = measure.textbbox((0, 0), label, font=font)
+                geom["label_w"] = bbox[2] - bbox[0]
+                geom["label_h"] = bbox[3] - bbox[1]
+
+            if ctype == "switch":
+                rail_h = h // 3
+                geom["rail_h"] = rail_h
+                geom["toggle_r"] = max(5, rail_h * 0.7)
+            elif ctype == "slider":
+                track_h = h // 8
+                geom["track_h"] = track_h
+                geom["thumb_r"] = max(5, track_h * 1.2)
+            elif ctype == "button":
+                geom["button_w"] = min(w, h * 1.5)
+                geom["button_h"] = h // 2
+            elif ctype == "dial":
+                dial_r = max(15, min(w, h) // 3)
+                geom["dial_r"] = dial_r
+                geom["indicator_len"] = dial_r * 0.7
+                geom["center_r"] = dial_r // 8
+
+            panel.geometries[j] = geom
+
     def _render_panel(self, panel_data: Dict, render_target: bool = False) -> Image.Image:
         """Render the control panel in initial or target state."""
         panel = panel_data["panel"]
@@ -216,27 +373,58 @@ class TaskGenerator(BaseGenerator):
         
         # Draw panel frame/border
         margin = 20
-        frame_color = (80, 80, 90)
         draw.rectangle(
             [margin, margin, width - margin, height - margin],
-            outline=frame_color,
+            outline=_COL_FRAME,
             width=3
         )
         
         # Draw each control
-        for control in panel.controls:
-            state = control["target_state"] if render_target else control["initial_state"]
-            # Get font for this control (will use internal fallback if None)
-            font_size = max(12, min(control["size"][0], control["size"][1]) // 6)
-            font = self._get_font(font_size)
-            self._draw_control(
-                draw, control, state, control["label"], font
-            )
-        
+        states = panel.target_states if render_target else panel.initial_states
+        for j in range(len(panel)):
+            x, y = panel.positions[j]
+            w, h = panel.sizes[j]
+            self._draw_control(draw, panel.types[j], x, y, w, h, states[j],
+                               panel.labels[j], panel.geometries[j])
+
         return img
+
+    def _render_panel_pair(self, panel_data: Dict) -> Tuple[Image.Image, Image.Image]:
+        """Render the initial and target panel states in one control traversal."""
+        panel = panel_data["panel"]
+        width, height = self.config.image_size
+
+        initial_img = Image.new('RGB', (width, height), self.config.panel_bg_color)
+        final_img = Image.new('RGB', (width, height), self.config.panel_bg_color)
+        initial_draw = ImageDraw.Draw(initial_img)
+        final_draw = ImageDraw.Draw(final_img)
+
+        # Draw panel frame/border on both images
+        margin = 20
+        for draw in (initial_draw, final_draw):
+            draw.rectangle(
+                [margin, margin, width - margin, height - margin],
+                outline=_COL_FRAME,
+                width=3
+            )
+
+        # Single pass: draw each control's initial and target state together
+        for j in range(len(panel)):
+            ctype = panel.types[j]
+            x, y = panel.positions[j]
+            w, h = panel.sizes[j]
+            label = panel.labels[j]
+            geom = panel.geometries[j]
+            self._draw_control(initial_draw, ctype, x, y, w, h,
+                               panel.initial_states[j], label, geom)
+            self._draw_control(final_draw, ctype, x, y, w, h,
+                               panel.target_states[j], label, geom)
+
+        return initial_img, final_img
     
-    def _get_font(self, size: int):
-        """Get a font, trying multiple fallbacks."""
+    @staticmethod
+    def _find_font_path() -> Optional[str]:
+        """Find the first usable font file on this system."""
         # Try common font paths
         font_paths = [
             "/System/Library/Fonts/Helvetica.ttc",  # macOS
@@ -245,80 +433,87 @@ class TaskGenerator(BaseGenerator):
             "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf",  # Linux
             "C:/Windows/Fonts/arial.ttf",  # Windows
         ]
-        
+
         for path in font_paths:
             try:
-                return ImageFont.truetype(path, size)
+                ImageFont.truetype(path, 12)
+                return path
             except (OSError, IOError):
                 continue
-        
-        # Fallback to default font
-        try:
-            return ImageFont.load_default()
-        except:
-            return None
-    
-    def _draw_control(self, draw: ImageDraw.Draw, control: Dict, 
-                     state: any, label: str, font=None):
-        """Draw a single control."""
-        ctype = control["type"]
-        x, y = control["position"]
-        w, h = control["size"]
-        
-        # Try to get a font if not provided
+        return None
+
+    def _get_font(self, size: int):
+        """Get a font for the given size, cached so each size loads once."""
+        if size in self._font_cache:
+            return self._font_cache[size]
+
+        font = None
+        if self._font_path is not None:
+            try:
+                font = ImageFont.truetype(self._font_path, size)
+            except (OSError, IOError):
+                font = None
+
         if font is None:
-            font_size = max(12, min(w, h) // 6)
-            font = self._get_font(font_size)
-        
+            # Fallback to default font
+            try:
+                font = ImageFont.load_default()
+            except:
+                font = None
+
+        self._font_cache[size] = font
+        return font
+    
+    def _draw_control(self, draw: ImageDraw.Draw, ctype: str, x: int, y: int,
+                     w: int, h: int, state: any, label: str, geom: Dict):
+        """Draw a single control using its precomputed geometry."""
         if ctype == "switch":
-            self._draw_switch(draw, x, y, w, h, state, label, font)
+            self._draw_switch(draw, x, y, w, h, state, label, geom)
         elif ctype == "slider":
-            self._draw_slider(draw, x, y, w, h, state, label, font)
+            self._draw_slider(draw, x, y, w, h, state, label, geom)
         elif ctype == "button":
-            self._draw_button(draw, x, y, w, h, state, label, font)
+            self._draw_button(draw, x, y, w, h, state, label, geom)
         elif ctype == "dial":
-            self._draw_dial(draw, x, y, w, h, state, label, font)
+            self._draw_dial(draw, x, y, w, h, state, label, geom)
     
-    def _draw_switch(self, draw: ImageDraw.Draw, x: int, y: int, 
-                    w: int, h: int, is_on: bool, label: str, font):
+    def _draw_switch(self, draw: ImageDraw.Draw, x: int, y: int,
+                    w: int, h: int, is_on: bool, label: str, geom: Dict):
         """Draw a toggle switch."""
         # Switch background (rail)
-        rail_h = h // 3
+        rail_h = geom["rail_h"]
         rail_y = y - rail_h // 2
-        rail_color = (60, 60, 70) if not is_on else (60, 150, 80)
+        rail_color = _COL_RAIL_OFF if not is_on else _COL_RAIL_ON
         draw.rounded_rectangle(
             [x - w // 2, rail_y, x + w // 2, rail_y + rail_h],
             radius=rail_h // 2,
             fill=rail_color
         )
-        
+
         # Switch toggle (circle)
-        toggle_r = max(5, rail_h * 0.7)  # Ensure minimum radius
+        toggle_r = geom["toggle_r"]
         toggle_x = x + int((w // 2 - toggle_r * 1.2)) if is_on else x - int((w // 2 - toggle_r * 1.2))
         toggle_y = y
-        toggle_color = (220, 220, 220)
         draw.ellipse(
             [toggle_x - toggle_r, toggle_y - toggle_r,
              toggle_x + toggle_r, toggle_y + toggle_r],
-            fill=toggle_color,
-            outline=(40, 40, 50),
+            fill=_COL_KNOB,
+            outline=_COL_KNOB_OUTLINE,
             width=2
         )
-        
+
         # Label
+        font = geom["font"]
         if font and label:
-            bbox = draw.textbbox((0, 0), label, font=font)
-            label_w = bbox[2] - bbox[0]
-            draw.text((x - label_w // 2, y - h // 2 + 5), label, 
-                     fill=(200, 200, 200), font=font)
+            draw.text((x - geom["label_w"] // 2, y - h // 2 + 5), label,
+                     fill=_COL_LABEL, font=font)
     
     def _draw_slider(self, draw: ImageDraw.Draw, x: int, y: int,
-                    w: int, h: int, value: int, label: str, font):
+                    w: int, h: int, value: int, label: str, geom: Dict):
         """Draw a slider control."""
         # Slider track
-        track_h = h // 8
+        track_h = geom["track_h"]
         track_y = y
-        track_color = (60, 60, 70)
+        track_color = _COL_TRACK
         draw.rounded_rectangle(
             [x - w // 2, track_y - track_h // 2,
              x + w // 2, track_y + track_h // 2],
@@ -328,7 +523,7 @@ class TaskGenerator(BaseGenerator):
         
         # Filled portion (progress)
         fill_w = int((w - track_h) * value / 100)
-        fill_color = (70, 130, 200)
+        fill_color = _COL_TRACK_FILL
         if fill_w > 0:
             draw.rounded_rectangle(
                 [x - w // 2, track_y - track_h // 2,
@@ -338,7 +533,7 @@ class TaskGenerator(BaseGenerator):
             )
         
         # Slider thumb
-        thumb_r = max(5, track_h * 1.2)  # Ensure minimum radius
+        thumb_r = geom["thumb_r"]
         # Clamp value to valid range
         value = max(0, min(100, value))
         thumb_x = x - w // 2 + int((w - track_h) * value / 100)
@@ -346,42 +541,41 @@ class TaskGenerator(BaseGenerator):
         draw.ellipse(
             [thumb_x - thumb_r, thumb_y - thumb_r,
              thumb_x + thumb_r, thumb_y + thumb_r],
-            fill=(220, 220, 220),
-            outline=(40, 40, 50),
+            fill=_COL_KNOB,
+            outline=_COL_KNOB_OUTLINE,
             width=2
         )
         
         # Label
+        font = geom["font"]
         if font and label:
-            bbox = draw.textbbox((0, 0), label, font=font)
-            label_w = bbox[2] - bbox[0]
-            draw.text((x - label_w // 2, y - h // 2 + 5), label,
-                     fill=(200, 200, 200), font=font)
-        
-        # Value text
+            draw.text((x - geom["label_w"] // 2, y - h // 2 + 5), label,
+                     fill=_COL_LABEL, font=font)
+
+        # Value text (width depends on the current value, so measure here)
         if font:
             value_text = f"{value}%"
             bbox = draw.textbbox((0, 0), value_text, font=font)
             value_w = bbox[2] - bbox[0]
             draw.text((x - value_w // 2, y + h // 2 - 20), value_text,
-                     fill=(180, 180, 180), font=font)
+                     fill=_COL_VALUE_TEXT, font=font)
     
     def _draw_button(self, draw: ImageDraw.Draw, x: int, y: int,
-                    w: int, h: int, is_pressed: bool, label: str, font):
+                    w: int, h: int, is_pressed: bool, label: str, geom: Dict):
         """Draw a button control."""
         # Button shape
-        button_w = min(w, h * 1.5)
-        button_h = h // 2
-        
+        button_w = geom["button_w"]
+        button_h = geom["button_h"]
+
         if is_pressed:
-            button_color = (80, 150, 80)
+            button_color = _COL_BUTTON_PRESSED
             shadow_offset = 1
         else:
-            button_color = (100, 120, 150)
+            button_color = _COL_BUTTON_IDLE
             shadow_offset = 3
         
         # Shadow
-        shadow_color = (20, 20, 25)
+        shadow_color = _COL_BUTTON_SHADOW
         draw.rounded_rectangle(
             [x - button_w // 2 + shadow_offset, y + shadow_offset,
              x + button_w // 2 + shadow_offset, y + button_h + shadow_offset],
@@ -395,63 +589,59 @@ class TaskGenerator(BaseGenerator):
              x + button_w // 2, y + button_h],
             radius=button_h // 4,
             fill=button_color,
-            outline=(60, 60, 70),
+            outline=_COL_OUTLINE,
             width=2
         )
         
         # Label
+        font = geom["font"]
         if font and label:
-            bbox = draw.textbbox((0, 0), label, font=font)
-            label_w = bbox[2] - bbox[0]
-            label_h = bbox[3] - bbox[1]
             draw.text(
-                (x - label_w // 2, y + (button_h - label_h) // 2),
+                (x - geom["label_w"] // 2, y + (button_h - geom["label_h"]) // 2),
                 label,
-                fill=(255, 255, 255),
+                fill=_COL_BUTTON_LABEL,
                 font=font
             )
     
     def _draw_dial(self, draw: ImageDraw.Draw, x: int, y: int,
-                  w: int, h: int, angle: int, label: str, font):
+                  w: int, h: int, angle: int, label: str, geom: Dict):
         """Draw a dial/knob control."""
         # Dial body (circle)
-        dial_r = max(15, min(w, h) // 3)  # Ensure minimum radius
+        dial_r = geom["dial_r"]
         # Normalize angle to [0, 360)
         angle = angle % 360
-        dial_color = (80, 80, 90)
+        dial_color = _COL_DIAL
         draw.ellipse(
             [x - dial_r, y - dial_r,
              x + dial_r, y + dial_r],
             fill=dial_color,
-            outline=(60, 60, 70),
+            outline=_COL_OUTLINE,
             width=3
         )
         
-        # Dial indicator (line/pointer)
-        angle_rad = math.radians(angle - 90)  # 0° at top
-        indicator_len = dial_r * 0.7
-        end_x = x + indicator_len * math.cos(angle_rad)
-        end_y = y + indicator_len * math.sin(angle_rad)
+        # Dial indicator (line/pointer) - direction comes from the LUT
+        indicator_len = geom["indicator_len"]
+        end_x = x + indicator_len * _DIAL_COS[angle]
+        end_y = y + indicator_len * _DIAL_SIN[angle]
         draw.line(
             [(x, y), (end_x, end_y)],
-            fill=(255, 200, 50),
+            fill=_COL_DIAL_POINTER,
             width=4
         )
         
         # Center dot
-        center_r = dial_r // 8
+        center_r = geom["center_r"]
         draw.ellipse(
             [x - center_r, y - center_r,
              x + center_r, y + center_r],
-            fill=(200, 200, 200)
+            fill=_COL_DIAL_CENTER
         )
-        
+
         # Label
+        font = geom["font"]
         if font and label:
-            bbox = draw.textbbox((0, 0), label, font=font)
-            label_w = bbox[2] - bbox[0]
-            draw.text((x - label_w // 2, y - h // 2 + 5), label,
-                     fill=(200, 200, 200), font=font)
+            draw.text((x - geom["label_w"] // 2, y - h // 2 + 5), label,
+                     fill=_COL_LABEL, font=font)
     
     # ══════════════════════════════════════════════════════════════════════════
     #  VIDEO GENERATION
@@ -465,9 +655,7 @@ class TaskGenerator(BaseGenerator):
         panel_data: Dict
     ) -> Optional[str]:
         """Generate ground truth video showing control operations."""
-        temp_dir = Path(tempfile.gettempdir()) / f"{self.config.domain}_videos"
-        temp_dir.mkdir(parents=True, exist_ok=True)
-        video_path = temp_dir / f"{task_id}_ground_truth.mp4"
+        video_path = self._video_dir / f"{task_id}_ground_truth.mp4"
         
         # Create animation frames showing controls changing
         frames = self._create_panel_animation_frames(panel_data)
@@ -484,70 +672,126 @@ class TaskGenerator(BaseGenerator):
         panel_data: Dict,
         hold_frames: int = 5,
         transition_frames: int = 30
-    ) -> List[Image.Image]:
-        """Create animation frames showing controls transitioning."""
+    ) -> List:
+        """
+        Create animation frames showing controls transitioning.
+
+        Hold frames are PIL Images; transition frames are RGB uint8 arrays
+        backed by a single shared buffer. Both are accepted by
+        VideoGenerator.create_video_from_frames.
+        """
         panel = panel_data["panel"]
         frames = []
         width, height = self.config.image_size
         
-        # Initial state
+        # Initial state. Hold frames are pixel-identical, and the video encoder
+        # only reads frame pixels, so repeating the reference avoids copies.
         initial_img = self._render_panel(panel_data, render_target=False)
-        for _ in range(hold_frames):
-            frames.append(initial_img.copy())
-        
+        frames.extend([initial_img] * hold_frames)
+        
+        # Base frame: background plus panel border, rendered once. During the
+        # transition we keep a working image and only redraw controls whose
+        # interpolated state changed since the previous frame (switches and
+        # buttons flip once; only sliders/dials move continuously).
+        base = Image.new('RGB', (width, height), self.config.panel_bg_color)
+        base_draw = ImageDraw.Draw(base)
+        margin = 20
+        base_draw.rectangle(
+            [margin, margin, width - margin, height - margin],
+            outline=_COL_FRAME,
+            width=3
+        )
+
+        # Per-control clear regions, padded to the control's actual drawn
+        # extents: a few pixels of slack covers button shadows, and slider
+        # thumbs overhang the track ends by up to their radius
+        num_controls = len(panel)
+        control_boxes = []
+        base_patches = []
+        for j in range(num_controls):
+            x, y = panel.positions[j]
+            w, h = panel.sizes[j]
+            pad = 4
+            if panel.types[j] == "slider":
+                pad += math.ceil(panel.geometries[j]["thumb_r"])
+            box = (max(0, x - w // 2 - pad), max(0, y - h // 2 - pad),
+                   min(width, x + w // 2 + pad), min(height, y + h // 2 + pad))
+            control_boxes.append(box)
+            base_patches.append(base.crop(box))
+
+        current = base.copy()
+        current_draw = ImageDraw.Draw(current)
+        prev_states = [None] * num_controls
+
+        # One contiguous pixel buffer backs every transition frame, replacing
+        # a full Image copy per frame; the video encoder consumes the rows as
+        # RGB arrays directly
+        buf = np.empty((transition_frames, height, width, 3), dtype=np.uint8)
+
+        # Precompute each control's full per-frame state trajectory up front
+        # (vectorized), so the frame loop just indexes into it
+        control_trajs = [
+            self._interpolate_state_trajectory(
+                panel.types[j], panel.initial_states[j], panel.target_states[j],
+                transition_frames
+            )
+            for j in range(num_controls)
+        ]
+
+        # Local references keep attribute lookups out of the frame loop
+        types = panel.types
+        positions = panel.positions
+        sizes = panel.sizes
+        labels = panel.labels
+        geometries = panel.geometries
+
         # Transition frames - interpolate between initial and target states
         for i in range(transition_frames):
-            progress = i / (transition_frames - 1) if transition_frames > 1 else 1.0
-            
-            # Create interpolated frame
-            img = Image.new('RGB', (width, height), self.config.panel_bg_color)
-            draw = ImageDraw.Draw(img)
-            
-            # Draw panel frame
-            margin = 20
-            frame_color = (80, 80, 90)
-            draw.rectangle(
-                [margin, margin, width - margin, height - margin],
-                outline=frame_color,
-                width=3
-            )
-            
-            # Draw each control with interpolated state
-            for control in panel.controls:
-                initial_state = control["initial_state"]
-                target_state = control["target_state"]
-                interpolated_state = self._interpolate_control_state(
-                    control["type"], initial_state, target_state, progress
-                )
-                # Get font for this control (will use internal fallback if None)
-                font_size = max(12, min(control["size"][0], control["size"][1]) // 6)
-                font = self._get_font(font_size)
-                self._draw_control(draw, control, interpolated_state, control["label"], font)
-            
-            frames.append(img)
+            # Redraw only the controls whose interpolated state changed
+            changed = []
+            for j in range(num_controls):
+                interpolated_state = control_trajs[j][i]
+                if interpolated_state == prev_states[j]:
+                    continue
+                # Restore the control's region to the background, then redraw
+                current.paste(base_patches[j], control_boxes[j][:2])
+                x, y = positions[j]
+                w, h = sizes[j]
+                self._draw_control(current_draw, types[j], x, y, w, h,
+                                   interpolated_state, labels[j], geometries[j])
+                prev_states[j] = interpolated_state
+                changed.append(j)
+
+            # Snapshot into the shared buffer: carry over the previous frame's
+            # pixels and update only the regions that were redrawn
+            if i == 0:
+                buf[0] = np.asarray(current)
+            else:
+                np.copyto(buf[i], buf[i - 1])
+                for j in changed:
+                    x0, y0, x1, y1 = control_boxes[j]
+                    buf[i, y0:y1, x0:x1] = np.asarray(current.crop(control_boxes[j]))
+
+            frames.append(buf[i])
         
         # Final state
         final_img = self._render_panel(panel_data, render_target=True)
-        for _ in range(hold_frames):
-            frames.append(final_img.copy())
+        frames.extend([final_img] * hold_frames)
         
         return frames
     
-    def _interpolate_control_state(self, control_type: str, initial: any,
-                                  target: any, progress: float) -> any:
-        """Interpolate between initial and target states."""
-        if control_type == "switch":
-            # Switch flips at 50% progress
-            return target if progress >= 0.5 else initial
-        
-        elif control_type == "slider":
+    def _interpolate_state_trajectory(self, control_type: str, initial: any,
+                                      target: any, num_frames: int) -> List:
+        """Interpolated per-frame states for one control across a transition."""
+        if num_frames > 1:
+            progress = np.linspace(0.0, 1.0, num_frames)
+        else:
+            progress = np.ones(1)
+
+        if control_type == "slider":
             # Linear interpolation for slider
-            return int(initial + (target - initial) * progress)
-        
-        elif control_type == "button":
-            # Button activates at 50% progress
-            return target if progress >= 0.5 else initial
-        
+            return (initial + (target - initial) * progress).astype(int).tolist()
+
         elif control_type == "dial":
             # Circular interpolation for dial (handle wrap-around)
             diff = target - initial
@@ -556,10 +800,8 @@ class TaskGenerator(BaseGenerator):
                 diff -= 360
             elif diff < -180:
                 diff += 360
-            result = initial + diff * progress
-            # Normalize to [0, 360]
-            result = result % 360
-            return int(result)
-        
+            return _dial_arc_trajectory(float(initial), float(diff), num_frames).tolist()
+
         else:
-            return target if progress >= 0.5 else initial
+            # Switches and buttons flip at 50% progress
+            return np.where(progress >= 0.5, target, initial).tolist()